@@ -1,6 +1,24 @@
-import math
+import codecs
+import hashlib
+import json
+import mmap
+import os
 import random
-from typing import List, Literal, Optional, Set, Type
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from crewai.llms.base_llm import BaseLLM
 from crewai.tools.base_tool import BaseTool
@@ -12,19 +30,202 @@ from pydantic import (
     model_validator,
 )
 
+try:  # Much faster JSON rendering when available
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_TOOL_FILE_FAST_READ_MIN_BYTES: int = 1024 * 1024
+_TOOL_FILE_LINE_SEEK_MIN_START: int = 1_000
+_TOOL_FILE_MMAP_MIN_BYTES: int = 65_536
+_TOOL_FILE_SPLITLINES_MAX_BYTES: int = 32 * 1024 * 1024
 _TOOL_FILE_RANDOM_CHUNKS_BLOCK_SIZE: int = 1_000
+_TOOL_FILE_READ_BUFFER_BYTES: int = 262_144
 _TOOL_FILE_RANDOM_CHUNKS_MIN_MAX_CHARS: int = 3_000
 _TOOL_FILE_SUMMARY_MODE_INTERNAL_MAX_CHARS: int = 34_000
 _TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH: int = 6_000
 _TOOL_FILE_SUMMARY_MIN_VALID_LENGTH: int = 100
 
+# The instructions are interpolated once at module load so the prompt
+# prefix is byte-for-byte identical across calls and documents, which
+# is what provider-side prompt prefix caches match on.
 DEFAULT_FILE_SUMMARY_PROMPT_TEMPLATE: str = (
     "Provide a concise summary of the file content below, capturing the "
     "main points and all key information. The summary should be up to "
     f"{_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH} characters long.\n\n"
-    "File content to summarize:\n\n"
+    "---BEGIN FILE CONTENT---\n"
 )
 
+_SUMMARY_PROMPT_SUFFIX: str = "\n---END FILE CONTENT---\nSummary:"
+
+# Static description fragments, hoisted so instantiating many tool
+# copies does not rebuild identical strings each time.
+_DESC_NO_DEFAULT_PATH: str = (
+    "No default file path configured; a file path must be "
+    "provided at runtime."
+)
+_DESC_DEFAULT_PROMPT: str = "Uses a default summarization prompt."
+_DESC_CUSTOM_PROMPT: str = "Uses a custom summarization prompt."
+
+
+def _decode_chunk_bytes(data: bytes) -> str:
+    # An incremental decoder buffers (rather than mangles) a multibyte
+    # sequence split at the chunk's trailing edge.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return decoder.decode(data)
+
+
+def _read_all_fast(file_path: str, size: int) -> bytearray:
+    """
+    Reads a whole file of a known size through os.readv into a
+    preallocated buffer, bypassing the BufferedReader layer and its
+    intermediate copies on the multi-megabyte path.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+        while offset < size:
+            bytes_read = os.readv(fd, [view[offset:]])
+            if bytes_read == 0:
+                break
+            offset += bytes_read
+        view.release()
+        if offset < size:  # File shrank since it was stat'ed
+            del buffer[offset:]
+        return buffer
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=32)
+def _read_text_cached(file_path: str, stat_key: Tuple[int, int]) -> str:
+    """
+    Reads and decodes a whole file, memoized on (mtime_ns, size) so
+    repeated reads of an unchanged file within an agent loop are served
+    from memory. Invalidation is implicit: a modified file produces a
+    new stat_key.
+    """
+    # Read raw bytes and decode once; this skips TextIOWrapper's
+    # incremental per-chunk decoding on the whole-file path. Encoding
+    # mismatches are still handled by replacing invalid characters.
+    size = stat_key[1]
+    if size >= _TOOL_FILE_FAST_READ_MIN_BYTES and hasattr(os, "readv"):
+        # os.readv is POSIX-only; elsewhere the buffered path below
+        # handles large files too.
+        return _read_all_fast(file_path, size).decode(
+            "utf-8", errors="replace"
+        )
+    # Path.read_bytes skips the BufferedReader allocation and the
+    # extra seek/isatty syscalls an open() round-trip performs.
+    return Path(file_path).read_bytes().decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=32)
+def _read_head_cached(
+    file_path: str, stat_key: Tuple[int, int], max_chars: int
+) -> str:
+    """
+    Bounded head read, memoized on the same stat key as the whole-file
+    cache; head output is deterministic for an unchanged file, so
+    repeat calls skip the read entirely.
+    """
+    # UTF-8 characters are at most 4 bytes, so reading this many
+    # bytes is guaranteed to cover the first max_chars characters.
+    with open(
+        file_path, "rb", buffering=_TOOL_FILE_READ_BUFFER_BYTES
+    ) as f:
+        data = f.read(max_chars * 4)
+    return data.decode("utf-8", errors="replace")[:max_chars]
+
+
+def _stat_key(stat_result: os.stat_result) -> Tuple[int, int]:
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _chunk_seed(stat_result: os.stat_result) -> int:
+    """
+    Derives a deterministic chunk-selection seed from a file's stat.
+    Identical file state yields identical sampled chunks across calls,
+    which keeps summarize prompts byte-for-byte stable so provider-side
+    prompt caches can actually hit.
+    """
+    return stat_result.st_mtime_ns ^ stat_result.st_size
+
+
+@lru_cache(maxsize=64)
+def _build_description(
+    retrieval_mode: str,
+    file_path: Optional[str],
+    start_line: int,
+    line_count: Optional[int],
+    eff_max_chars: Optional[int],
+    uses_default_prompt: bool,
+) -> str:
+    """
+    Renders the dynamic tool description for one configuration.
+    Memoized so factories that instantiate many identically configured
+    tools format the string once.
+    """
+    path_detail = (
+        f"Default file path configured: '{file_path}'. "
+        "A different path can be provided at runtime."
+        if file_path
+        else _DESC_NO_DEFAULT_PATH
+    )
+
+    line_detail: Optional[str] = None
+    if retrieval_mode == "full":
+        line_detail = (
+            f"For 'full' mode: starts reading at line {start_line}."
+            + (
+                f" Reads up to {line_count} lines."
+                if line_count is not None
+                else " Reads until the end of the file."
+            )
+        )
+
+    chars_detail: Optional[str] = None
+    if (
+        retrieval_mode in ["head", "random_chunks"]
+        and eff_max_chars is not None
+    ):
+        chars_detail = (
+            f"It's configured to process up to "
+            f"{eff_max_chars} characters."
+        )
+    elif retrieval_mode == "summarize" and eff_max_chars is not None:
+        chars_detail = (
+            f"For 'summarize' mode: it will process up to "
+            f"{eff_max_chars} characters of file "
+            f"content before summarizing. The final summary aims for "
+            f"approx. {_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH} characters."
+        )
+
+    prompt_detail: Optional[str] = None
+    if retrieval_mode == "summarize":
+        prompt_detail = (
+            _DESC_DEFAULT_PROMPT
+            if uses_default_prompt
+            else _DESC_CUSTOM_PROMPT
+        )
+
+    # One join over the applicable fragments; no list mutation or
+    # repeated string concatenation.
+    return " ".join(
+        fragment
+        for fragment in (
+            f"Reads content from a file using the "
+            f"'{retrieval_mode}' strategy.",
+            path_detail,
+            line_detail,
+            chars_detail,
+            prompt_detail,
+        )
+        if fragment
+    )
+
 
 class VersatileFileReadToolSchema(BaseModel):
     """Input schema for VersatileFileReadTool's run method."""
@@ -59,9 +260,37 @@ class VersatileFileReadToolOutput(BaseModel):
 
     def to_llm_response(self) -> str:
         """Converts the output to a JSON string for the LLM."""
+        if orjson is not None:
+            return orjson.dumps(
+                self.model_dump(exclude_none=True),
+                option=orjson.OPT_INDENT_2,
+            ).decode()
         return self.model_dump_json(exclude_none=True, indent=2)
 
 
+def _error_response(
+    error_message: str,
+    source_file_path: str,
+    retrieval_mode_used: str,
+) -> str:
+    """Renders an error payload without building a Pydantic model.
+
+    Error paths can fire once per file during batch sweeps over missing
+    or unreadable paths; the payload shape is fixed, so serializing the
+    dict directly skips model validation on that hot path. The JSON
+    matches what VersatileFileReadToolOutput.to_llm_response() emits
+    for an error (None fields excluded, two-space indent).
+    """
+    payload = {
+        "error_message": error_message,
+        "source_file_path": source_file_path,
+        "retrieval_mode_used": retrieval_mode_used,
+    }
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(payload, indent=2)
+
+
 class VersatileFileReadTool(BaseTool):
     """
     A versatile tool to read file content using various strategies.
@@ -124,6 +353,11 @@ class VersatileFileReadTool(BaseTool):
     )
 
     _eff_max_chars_for_retrieval: Optional[int] = PrivateAttr(default=None)
+    _dispatch: Optional[Callable[[str], str]] = PrivateAttr(default=None)
+
+    # Completed summaries keyed by prompt hash; summarization is pure in
+    # its prompt, so repeated runs over the same content skip the LLM.
+    _summary_cache: ClassVar[Dict[str, str]] = {}
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
@@ -161,64 +395,25 @@ class VersatileFileReadTool(BaseTool):
                 self.max_chars, _TOOL_FILE_RANDOM_CHUNKS_MIN_MAX_CHARS
             )
 
-        base_desc_intro = (
-            f"Reads content from a file using the '{self.retrieval_mode}' "
-            "strategy."
+        # Resolve the mode handler once; _run then dispatches through a
+        # single attribute call instead of re-comparing mode strings.
+        self._dispatch = {
+            "full": self._do_full,
+            "head": self._do_head,
+            "random_chunks": self._do_random_chunks,
+            "summarize": self._do_summarize,
+        }[self.retrieval_mode]
+
+        self.description = _build_description(
+            self.retrieval_mode,
+            self.file_path,
+            self.start_line,
+            self.line_count,
+            self._eff_max_chars_for_retrieval,
+            self.summary_prompt_template
+            == DEFAULT_FILE_SUMMARY_PROMPT_TEMPLATE,
         )
-        details = []
-
-        if self.file_path:
-            details.append(
-                f"Default file path configured: '{self.file_path}'. "
-                "A different path can be provided at runtime."
-            )
-        else:
-            details.append(
-                "No default file path configured; a file path must be "
-                "provided at runtime."
-            )
 
-        if self.retrieval_mode == "full":
-            line_desc = "For 'full' mode: starts reading at line "
-            line_desc += f"{self.start_line}."
-            if self.line_count is not None:
-                line_desc += f" Reads up to {self.line_count} lines."
-            else:
-                line_desc += " Reads until the end of the file."
-            details.append(line_desc)
-
-        if (
-            self.retrieval_mode in ["head", "random_chunks"]
-            and self._eff_max_chars_for_retrieval is not None
-        ):
-            details.append(
-                f"It's configured to process up to "
-                f"{self._eff_max_chars_for_retrieval} characters."
-            )
-        elif (
-            self.retrieval_mode == "summarize"
-            and self._eff_max_chars_for_retrieval is not None
-        ):
-            details.append(
-                f"For 'summarize' mode: it will process up to "
-                f"{self._eff_max_chars_for_retrieval} characters of file "
-                f"content before summarizing. The final summary aims for "
-                f"approx. {_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH} characters."
-            )
-
-        if self.retrieval_mode == "summarize":
-            if (
-                self.summary_prompt_template
-                == DEFAULT_FILE_SUMMARY_PROMPT_TEMPLATE
-            ):
-                details.append("Uses a default summarization prompt.")
-            else:
-                details.append("Uses a custom summarization prompt.")
-
-        self.description = base_desc_intro
-        if details:
-            self.description += " " + " ".join(details)
-        
         # Rebuild the final description
         self._generate_description()
         
@@ -238,73 +433,20 @@ class VersatileFileReadTool(BaseTool):
         )
 
         if eff_fp_candidate is None or not eff_fp_candidate.strip():
-            output = VersatileFileReadToolOutput(
+            return _error_response(
                 error_message="A file path must be provided either during tool "
                 "initialization (as file_path) or at runtime.",
                 source_file_path=eff_fp_candidate or "No file path provided",
                 retrieval_mode_used=self.retrieval_mode,
             )
-            return output.to_llm_response()
 
         # Ensure eff_fp is a non-empty string after this check
         eff_fp = eff_fp_candidate.strip()
 
         try:
-            content_to_return: str
-            full_content_for_processing: Optional[str] = None
-
-            if self.retrieval_mode != "full":
-                # Handle encoding mismatches gracefully by replacing invalid characters
-                with open(eff_fp, "r", encoding="utf-8", errors="replace") as f:
-                    full_content_for_processing = f.read()
-
-                if (
-                    self.retrieval_mode in ["head", "random_chunks"]
-                    and self._eff_max_chars_for_retrieval is not None
-                    and len(full_content_for_processing)
-                    <= self._eff_max_chars_for_retrieval
-                ):
-                    output = VersatileFileReadToolOutput(
-                        read_content=full_content_for_processing,
-                        source_file_path=eff_fp,
-                        retrieval_mode_used=self.retrieval_mode,
-                    )
-                    return output.to_llm_response()
-
-            if self.retrieval_mode == "full":
-                content_to_return = self._retrieve_full_content(
-                    eff_fp, self.start_line, self.line_count
-                )
-            elif self.retrieval_mode == "head":
-                if full_content_for_processing is None:
-                    raise AssertionError(
-                        "Internal: content not loaded for head."
-                    )
-                content_to_return = self._retrieve_head_content(
-                    full_content_for_processing,
-                    self._eff_max_chars_for_retrieval,  # type: ignore
-                )
-            elif self.retrieval_mode == "random_chunks":
-                if full_content_for_processing is None:
-                    raise AssertionError(
-                        "Internal: content not loaded for chunks."
-                    )
-                content_to_return = self._retrieve_random_chunks_content(
-                    full_content_for_processing,
-                    self._eff_max_chars_for_retrieval,  # type: ignore
-                )
-            elif self.retrieval_mode == "summarize":
-                if full_content_for_processing is None:
-                    raise AssertionError(
-                        "Internal: content not loaded for summary."
-                    )
-                content_to_return = self._retrieve_summarized_content(
-                    full_content_for_processing,
-                )
-            else:
-                raise AssertionError(
-                    f"Invalid retrieval mode: {self.retrieval_mode}"
-                )
+            # Mode dispatch was resolved once at init time; each run is
+            # a single bound-method call instead of a branch chain.
+            content_to_return: str = self._dispatch(eff_fp)  # type: ignore
 
             output = VersatileFileReadToolOutput(
                 read_content=content_to_return,
@@ -313,30 +455,216 @@ class VersatileFileReadTool(BaseTool):
             )
             return output.to_llm_response()
         except FileNotFoundError:
-            output = VersatileFileReadToolOutput(
-                error_message=f"File not found at path: {eff_fp}",
-                source_file_path=eff_fp,
-                retrieval_mode_used=self.retrieval_mode,
-            )
+            error_message = f"File not found at path: {eff_fp}"
         except PermissionError:
-            output = VersatileFileReadToolOutput(
-                error_message=f"Permission denied for file: {eff_fp}",
-                source_file_path=eff_fp,
-                retrieval_mode_used=self.retrieval_mode,
-            )
+            error_message = f"Permission denied for file: {eff_fp}"
         except ValueError as ve:
-            output = VersatileFileReadToolOutput(
-                error_message=f"Processing error for {eff_fp}: {ve}",
-                source_file_path=eff_fp,
-                retrieval_mode_used=self.retrieval_mode,
-            )
+            error_message = f"Processing error for {eff_fp}: {ve}"
         except Exception as e:
-            output = VersatileFileReadToolOutput(
-                error_message=f"Unexpected error processing {eff_fp}: {e}",
-                source_file_path=eff_fp,
-                retrieval_mode_used=self.retrieval_mode,
+            error_message = f"Unexpected error processing {eff_fp}: {e}"
+        return _error_response(
+            error_message=error_message,
+            source_file_path=eff_fp,
+            retrieval_mode_used=self.retrieval_mode,
+        )
+
+    def _do_full(self, eff_fp: str) -> str:
+        return self._retrieve_full_content(
+            eff_fp, self.start_line, self.line_count
+        )
+
+    def _do_head(self, eff_fp: str) -> str:
+        return _read_head_cached(
+            eff_fp,
+            _stat_key(os.stat(eff_fp)),
+            self._eff_max_chars_for_retrieval,  # type: ignore
+        )
+
+    def _do_random_chunks(self, eff_fp: str) -> str:
+        stat_result = os.stat(eff_fp)
+        if self._prefers_plain_read(stat_result):
+            return self._retrieve_random_chunks_content(
+                _read_text_cached(eff_fp, _stat_key(stat_result)),
+                self._eff_max_chars_for_retrieval,  # type: ignore
+                seed=_chunk_seed(stat_result),
             )
-        return output.to_llm_response()
+        return self._sample_from_mapping(eff_fp, _chunk_seed(stat_result))
+
+    def _do_summarize(self, eff_fp: str) -> str:
+        stat_result = os.stat(eff_fp)
+        if self._prefers_plain_read(stat_result):
+            return self._retrieve_summarized_content(
+                _read_text_cached(eff_fp, _stat_key(stat_result)),
+                seed=_chunk_seed(stat_result),
+            )
+        return self._summarize_context(
+            self._sample_from_mapping(eff_fp, _chunk_seed(stat_result))
+        )
+
+    def _prefers_plain_read(self, stat_result: os.stat_result) -> bool:
+        # For small files mmap's page-fault overhead outweighs its
+        # savings; a plain (cached) read is cheaper and the content may
+        # already be hot.
+        eff_mc = self._eff_max_chars_for_retrieval
+        return (
+            eff_mc is not None and stat_result.st_size <= eff_mc
+        ) or stat_result.st_size < _TOOL_FILE_MMAP_MIN_BYTES
+
+    def _sample_from_mapping(self, eff_fp: str, seed: int) -> str:
+        # Memory-map the file so only the byte ranges that are actually
+        # returned need to be copied and decoded; summarize samples its
+        # context this way without materializing the file.
+        with open(eff_fp, "rb") as f:
+            mapped: Optional[mmap.mmap]
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                mapped = None
+            try:
+                return self._retrieve_from_mapped(
+                    mapped, seed=seed, fd=f.fileno()
+                )
+            finally:
+                if mapped is not None:
+                    mapped.close()
+
+    def _retrieve_from_mapped(
+        self,
+        mapped: Optional[mmap.mmap],
+        seed: Optional[int] = None,
+        fd: Optional[int] = None,
+    ) -> str:
+        eff_mc = self._eff_max_chars_for_retrieval
+
+        if mapped is None:  # Empty file
+            return ""
+
+        if (
+            self.retrieval_mode == "random_chunks"
+            and eff_mc is not None
+            and len(mapped) <= eff_mc
+        ):
+            # UTF-8 characters are at least one byte each, so a file
+            # whose byte size fits the limit also fits it in characters.
+            return mapped[:].decode("utf-8", errors="replace")
+
+        if self.retrieval_mode in ["random_chunks", "summarize"]:
+            # For summarize, eff_mc is the context limit resolved at
+            # init time, so this yields the summarization context.
+            return self._retrieve_random_chunks_from_mmap(
+                mapped, eff_mc, seed=seed, fd=fd  # type: ignore
+            )
+        raise AssertionError(
+            f"Invalid retrieval mode: {self.retrieval_mode}"
+        )
+
+    def _retrieve_random_chunks_from_mmap(
+        self,
+        mapped: mmap.mmap,
+        eff_max_chars: int,
+        seed: Optional[int] = None,
+        fd: Optional[int] = None,
+    ) -> str:
+        rng = random.Random(
+            seed if seed is not None else hash((len(mapped), eff_max_chars))
+        )
+        block_size = _TOOL_FILE_RANDOM_CHUNKS_BLOCK_SIZE
+        num_blocks_select = eff_max_chars // block_size
+        if num_blocks_select == 0 and eff_max_chars > 0:
+            num_blocks_select = 1
+
+        total_blocks = (len(mapped) + block_size - 1) // block_size
+        if total_blocks == 0:
+            return ""
+
+        # A memoryview slice is a zero-copy window into the mapping;
+        # only the decode itself touches the selected bytes.
+        view = memoryview(mapped)
+
+        def decode_block(index: int) -> str:
+            # An incremental decoder buffers (rather than mangles) a
+            # multibyte sequence split at the block's trailing edge.
+            decoder = codecs.getincrementaldecoder("utf-8")(
+                errors="replace"
+            )
+            return decoder.decode(
+                view[index * block_size : (index + 1) * block_size]
+            )
+
+        try:
+            if total_blocks <= num_blocks_select:
+                return ("...".join(
+                    decode_block(i) for i in range(total_blocks)
+                ))[:eff_max_chars]
+
+            selected_indices: Set[int] = set()
+            if num_blocks_select > 0:
+                selected_indices.add(0)
+            if num_blocks_select > 1 and total_blocks > 1:
+                if (total_blocks - 1) != 0:
+                    selected_indices.add(total_blocks - 1)
+
+            needed_middle = num_blocks_select - len(selected_indices)
+
+            if needed_middle > 0 and total_blocks > 2:
+                selected_indices.update(
+                    rng.sample(
+                        range(1, total_blocks - 1),
+                        min(needed_middle, total_blocks - 2),
+                    )
+                )
+
+            sorted_indices = sorted(selected_indices)
+
+            can_prefetch = hasattr(mapped, "madvise") and hasattr(
+                mmap, "MADV_WILLNEED"
+            )
+
+            if len(sorted_indices) > 1 and can_prefetch:
+                # Batch-announce the scattered reads to the kernel:
+                # disable readahead between blocks and queue an async
+                # prefetch per selected range, so the page faults below
+                # hit warm pages. Not worth the calls for one block.
+                page_size = mmap.PAGESIZE
+                mapped.madvise(mmap.MADV_RANDOM)
+                for i in sorted_indices:
+                    start = (i * block_size) // page_size * page_size
+                    end = min((i + 1) * block_size, len(mapped))
+                    mapped.madvise(mmap.MADV_WILLNEED, start, end - start)
+                result_parts = [decode_block(i) for i in sorted_indices]
+            elif (
+                len(sorted_indices) > 1
+                and fd is not None
+                and hasattr(os, "pread")
+            ):
+                # Portable fallback without madvise: issue the scattered
+                # reads concurrently; os.pread releases the GIL, so the
+                # drive can serve the block fetches in parallel.
+                with ThreadPoolExecutor(
+                    max_workers=min(16, len(sorted_indices))
+                ) as executor:
+                    raw_blocks = list(
+                        executor.map(
+                            lambda i: os.pread(
+                                fd, block_size, i * block_size
+                            ),
+                            sorted_indices,
+                        )
+                    )
+                result_parts = [
+                    _decode_chunk_bytes(data) for data in raw_blocks
+                ]
+            else:
+                result_parts = [decode_block(i) for i in sorted_indices]
+
+            # Selection always drops blocks on this path, so the
+            # trailing ellipsis is unconditional; fold it into the one
+            # join instead of appending to the joined string.
+            return ("...".join(result_parts) + "...")[:eff_max_chars]
+        finally:
+            # Release before the caller closes the mapping; a live
+            # exported view would make mmap.close() raise BufferError.
+            view.release()
 
     def _retrieve_full_content(
         self,
@@ -345,46 +673,70 @@ class VersatileFileReadTool(BaseTool):
         line_count: Optional[int]
     ) -> str:
         try:
-            # Handle encoding mismatches gracefully by replacing invalid characters
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                if start_line == 1 and line_count is None:
-                    return f.read()
-
-                start_idx = start_line - 1
-                lines_buffer: List[str] = []
-                current_line_num = 0
-
-                for i, line_text in enumerate(f):
-                    current_line_num = i + 1
-                    if i >= start_idx:
-                        if (
-                            line_count is None
-                            or len(lines_buffer) < line_count
-                        ):
-                            lines_buffer.append(line_text)
-                        else:
-                            break
+            if start_line == 1 and line_count is None:
+                stat_result = os.stat(file_path)
+                return _read_text_cached(file_path, _stat_key(stat_result))
+
+            start_idx = start_line - 1
+            stop_idx = (
+                None if line_count is None else start_idx + line_count
+            )
+
+            # One stat up front settles the empty-file case without
+            # opening the file and feeds the size gates below.
+            stat_result = os.stat(file_path)
+            if stat_result.st_size == 0:
+                if start_line == 1:
+                    return ""
+                raise ValueError(
+                    "File is empty and start line is greater than 1."
+                )
+
+            if start_idx >= _TOOL_FILE_LINE_SEEK_MIN_START:
+                # Deep start lines: jump to the byte offset with a
+                # C-level newline scan instead of iterating (and
+                # decoding) thousands of unwanted line objects.
+                return self._retrieve_lines_via_mmap(
+                    file_path, start_idx, line_count
+                )
 
-                if (
-                    not lines_buffer
-                    and start_line > current_line_num
-                    and current_line_num > 0
-                ):
+            if stat_result.st_size < _TOOL_FILE_SPLITLINES_MAX_BYTES:
+                # Files that comfortably fit in RAM: read once and let
+                # bytes.splitlines run the newline scan in C instead of
+                # iterating line objects through the text layer.
+                with open(file_path, "rb") as f:
+                    data = f.read()
+                selected = data.splitlines(keepends=True)[start_idx:stop_idx]
+                if not selected:
+                    if start_line == 1:
+                        return ""
                     raise ValueError(
                         f"Start line {start_line} exceeds the number of "
-                        f"lines ({current_line_num}) in the file."
+                        "lines in the file."
                     )
-                if (
-                    not lines_buffer
-                    and start_line > 0
-                    and current_line_num == 0
-                ):
+                return b"".join(selected).decode("utf-8", errors="replace")
+
+            # Handle encoding mismatches gracefully by replacing invalid characters
+            with open(
+                file_path,
+                "r",
+                encoding="utf-8",
+                errors="replace",
+                buffering=_TOOL_FILE_READ_BUFFER_BYTES,
+            ) as f:
+                # islice advances the file iterator in C instead of
+                # running a per-line Python loop with index checks.
+                lines_buffer: List[str] = list(
+                    islice(f, start_idx, stop_idx)
+                )
+
+                if not lines_buffer:
                     if start_line == 1:
                         return ""
-                    else:
-                        raise ValueError(
-                            "File is empty and start line is greater than 1."
-                        )
+                    raise ValueError(
+                        f"Start line {start_line} exceeds the number of "
+                        "lines in the file."
+                    )
                 return "".join(lines_buffer)
         except ValueError:
             raise
@@ -393,93 +745,192 @@ class VersatileFileReadTool(BaseTool):
                 f"Error reading lines from file {file_path}: {str(e)}"
             ) from e
 
-    def _retrieve_head_content(
+    def _retrieve_lines_via_mmap(
         self,
-        full_content: str,
-        max_chars: int
+        file_path: str,
+        start_idx: int,
+        line_count: Optional[int],
     ) -> str:
-        if len(full_content) <= max_chars:
-            return full_content
-        return full_content[:max_chars]
+        start_line_error = ValueError(
+            f"Start line {start_idx + 1} exceeds the number of "
+            "lines in the file."
+        )
+
+        with open(file_path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                raise start_line_error
+            try:
+                pos = 0
+                for _ in range(start_idx):
+                    newline_at = mapped.find(b"\n", pos)
+                    if newline_at < 0:
+                        raise start_line_error
+                    pos = newline_at + 1
+                if pos >= len(mapped):
+                    raise start_line_error
+
+                if line_count is None:
+                    end = len(mapped)
+                else:
+                    end = pos
+                    for _ in range(line_count):
+                        newline_at = mapped.find(b"\n", end)
+                        if newline_at < 0:
+                            end = len(mapped)
+                            break
+                        end = newline_at + 1
+
+                return mapped[pos:end].decode("utf-8", errors="replace")
+            finally:
+                mapped.close()
 
     def _retrieve_random_chunks_content(
         self,
         full_content: str,
-        eff_max_chars: int
+        eff_max_chars: int,
+        seed: Optional[int] = None,
     ) -> str:
         if not full_content:
             return ""
         if len(full_content) <= eff_max_chars:
             return full_content
 
+        rng = random.Random(
+            seed
+            if seed is not None
+            else hash((len(full_content), eff_max_chars))
+        )
         block_size = _TOOL_FILE_RANDOM_CHUNKS_BLOCK_SIZE
-        num_blocks_select = math.floor(eff_max_chars / block_size)
+        num_blocks_select = eff_max_chars // block_size
         if num_blocks_select == 0 and eff_max_chars > 0:
             num_blocks_select = 1
 
-        all_blocks = [
-            full_content[i : i + block_size]
-            for i in range(0, len(full_content), block_size)
-        ]
-        if not all_blocks:
+        # Work with block indices only; slice just the selected ranges
+        # instead of materializing every block of the content.
+        total_blocks = (len(full_content) + block_size - 1) // block_size
+        if total_blocks == 0:
             return ""
 
-        if len(all_blocks) <= num_blocks_select:
-            return ("...".join(all_blocks))[:eff_max_chars]
-
-        selected_indices: Set[int] = set()
-        if num_blocks_select > 0:
-            selected_indices.add(0)
-        if num_blocks_select > 1 and len(all_blocks) > 1:
-            if (len(all_blocks) - 1) != 0:
-                selected_indices.add(len(all_blocks) - 1)
-
-        needed_middle = num_blocks_select - len(selected_indices)
-        middle_indices = [i for i in range(1, len(all_blocks) - 1)]
-
-        if needed_middle > 0 and middle_indices:
-            random.shuffle(middle_indices)
-            for i in range(min(needed_middle, len(middle_indices))):
-                selected_indices.add(middle_indices[i])
+        if total_blocks <= num_blocks_select:
+            return ("...".join(
+                full_content[i * block_size : (i + 1) * block_size]
+                for i in range(total_blocks)
+            ))[:eff_max_chars]
 
-        result_parts = [all_blocks[i] for i in sorted(list(selected_indices))]
+        # Build the ordered pick list directly (first, sorted middles,
+        # last) instead of accumulating a set and re-sorting it.
+        if num_blocks_select == 1:
+            picks = [0]
+        else:
+            needed_middle = min(num_blocks_select - 2, total_blocks - 2)
+            middle_picks = (
+                sorted(rng.sample(range(1, total_blocks - 1), needed_middle))
+                if needed_middle > 0
+                else []
+            )
+            picks = [0, *middle_picks, total_blocks - 1]
 
-        final_str = "...".join(result_parts)
-        # Add ellipsis if content was indeed truncated by selection
-        if len(all_blocks) > num_blocks_select and num_blocks_select > 0:
-            final_str += "..."
+        body = "...".join(
+            full_content[i * block_size : (i + 1) * block_size]
+            for i in picks
+        )
+        # Selection always truncated here, so mark it with an ellipsis
+        return (body + "...")[:eff_max_chars]
 
-        return final_str[:eff_max_chars]
+    def _call_summary_llm(
+        self,
+        llm: BaseLLM,
+        prompt: str,
+        context_for_summary: str,
+    ):
+        """
+        Calls the LLM preferring a messages-based invocation that sends
+        the static instruction header as a cacheable system message and
+        the document as the user message. Any failure of that form —
+        a call() that only takes a string, or a provider rejecting the
+        nonstandard cache_control key — falls back to the plain
+        single-prompt call within the same attempt.
+        """
+        try:
+            return llm.call(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.summary_prompt_template,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {
+                        "role": "user",
+                        "content": context_for_summary
+                        + _SUMMARY_PROMPT_SUFFIX,
+                    },
+                ]
+            )
+        except Exception:
+            return llm.call(prompt)
 
     def _retrieve_summarized_content(
         self,
-        full_content: str
+        full_content: str,
+        seed: Optional[int] = None,
     ) -> str:
-        llm = self.llm
         context_chars_limit = self._eff_max_chars_for_retrieval
 
-        if llm is None or context_chars_limit is None:
-            raise AssertionError("LLM or context limit not set for summarize.")
+        if context_chars_limit is None:
+            raise AssertionError("Context limit not set for summarize.")
 
-        context_for_summary = self._retrieve_random_chunks_content(
-            full_content, context_chars_limit
+        return self._summarize_context(
+            self._retrieve_random_chunks_content(
+                full_content, context_chars_limit, seed=seed
+            )
         )
+
+    def _summarize_context(self, context_for_summary: str) -> str:
+        llm = self.llm
+
+        if llm is None:
+            raise AssertionError("LLM not set for summarize.")
+
         if not context_for_summary.strip():
             raise ValueError("No content extracted from file to summarize.")
 
-        prompt = self.summary_prompt_template + context_for_summary
+        prompt = (
+            self.summary_prompt_template
+            + context_for_summary
+            + _SUMMARY_PROMPT_SUFFIX
+        )
+
+        cache_key = hashlib.blake2b(
+            prompt.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cached_summary = self._summary_cache.get(cache_key)
+        if cached_summary is not None:
+            return cached_summary
+
+        if getattr(llm, "supports_concurrent", False):
+            return self._summarize_with_concurrent_attempts(
+                llm, prompt, context_for_summary, cache_key
+            )
 
         raw_summary = ""
         last_exception: Optional[Exception] = None
         for attempt in range(3):  # Up to 3 attempts
             try:
-                llm_response = llm.call(prompt)
+                llm_response = self._call_summary_llm(
+                    llm, prompt, context_for_summary
+                )
 
                 if isinstance(llm_response, str):
                     summary = llm_response.strip()
 
                     if len(summary) >= _TOOL_FILE_SUMMARY_MIN_VALID_LENGTH:
-                        return summary[:_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH]
+                        final_summary = summary[
+                            :_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH
+                        ]
+                        self._summary_cache[cache_key] = final_summary
+                        return final_summary
                     else:
                         raw_summary = summary
                 else:  # Non-string response
@@ -488,6 +939,60 @@ class VersatileFileReadTool(BaseTool):
                 last_exception = e
 
         # All attempts failed
+        self._raise_summary_failure(raw_summary, last_exception)
+
+    def _summarize_with_concurrent_attempts(
+        self,
+        llm: BaseLLM,
+        prompt: str,
+        context_for_summary: str,
+        cache_key: str,
+    ) -> str:
+        """
+        Issues the three summary attempts concurrently and returns the
+        first valid result, so a slow or invalid attempt costs max(one
+        round-trip) instead of serializing three of them. Only used for
+        LLMs that advertise supports_concurrent.
+        """
+        raw_summary = ""
+        last_exception: Optional[Exception] = None
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(
+                    self._call_summary_llm, llm, prompt, context_for_summary
+                )
+                for _ in range(3)
+            ]
+            for future in as_completed(futures):
+                try:
+                    llm_response = future.result()
+                except Exception as e:
+                    last_exception = e
+                    continue
+
+                if isinstance(llm_response, str):
+                    summary = llm_response.strip()
+
+                    if len(summary) >= _TOOL_FILE_SUMMARY_MIN_VALID_LENGTH:
+                        for pending in futures:
+                            pending.cancel()
+                        final_summary = summary[
+                            :_TOOL_FILE_SUMMARY_MODE_TARGET_LENGTH
+                        ]
+                        self._summary_cache[cache_key] = final_summary
+                        return final_summary
+                    raw_summary = summary
+                else:  # Non-string response
+                    raw_summary = str(llm_response)
+
+        self._raise_summary_failure(raw_summary, last_exception)
+
+    def _raise_summary_failure(
+        self,
+        raw_summary: str,
+        last_exception: Optional[Exception],
+    ) -> None:
         error_msg_parts = [
             "LLM failed to generate a valid summary after 3 attempts."
         ]
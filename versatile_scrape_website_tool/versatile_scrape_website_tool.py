@@ -1,10 +1,19 @@
-import math
+import asyncio
+import hashlib
 import random
-import re
-from typing import Dict, Literal, Optional, Set, Type
+import time
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
-import requests
-from bs4 import BeautifulSoup
 from crewai.llms.base_llm import BaseLLM
 from crewai.tools.base_tool import BaseTool
 from pydantic import (
@@ -15,19 +24,160 @@ from pydantic import (
     model_validator,
 )
 
+if TYPE_CHECKING:  # Resolves the string annotations below without
+    import requests  # paying the import at runtime
+
+try:  # Much faster JSON rendering when available
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# requests, bs4 and lxml are imported lazily: they pull in urllib3,
+# charset detection and more, which is real startup cost for programs
+# that import many tools but only run a few. The module itself needs
+# nothing beyond pydantic and crewai until the first scrape.
+_lxml_html = None
+_lxml_checked: bool = False
+
+
+def _get_lxml_html():
+    """
+    Imports lxml.html on first use. The C parser is roughly an order
+    of magnitude faster than html.parser; None means it is missing and
+    the BeautifulSoup fallback applies.
+    """
+    global _lxml_html, _lxml_checked
+    if not _lxml_checked:
+        _lxml_checked = True
+        try:
+            import lxml.html
+
+            _lxml_html = lxml.html
+        except ImportError:
+            _lxml_html = None
+    return _lxml_html
+
+
+def _clean_whitespace(raw_text: str) -> str:
+    """
+    Collapses whitespace runs while preserving line structure: any run
+    of horizontal whitespace becomes one space, lines that clean up
+    empty disappear. split()/join run entirely inside the C fast paths
+    of str, which beats the regex interpreter on large documents.
+    """
+    return "\n".join(
+        filter(
+            None,
+            (" ".join(line.split()) for line in raw_text.split("\n")),
+        )
+    )
+
+
+# Tags whose text is markup noise rather than page content.
+_NON_CONTENT_TAGS: tuple = ("script", "style", "noscript", "template")
+_NON_CONTENT_XPATH: str = "//script|//style|//noscript|//template"
+
+
+def _extract_text(body: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Extracts visible text from raw HTML bytes. Prefers lxml's
+    C-implemented text_content() over the Python-level BeautifulSoup
+    tree walk; BS4 stays as the fallback when lxml is unavailable or
+    rejects pathological markup. `encoding` is the charset declared by
+    the HTTP headers, if any; lxml sniffs the document itself, while
+    the BS4 fallback uses the hint to skip its own detection pass.
+    """
+    lxml_html = _get_lxml_html()
+    if lxml_html is not None:
+        try:
+            tree = lxml_html.fromstring(body)
+            for element in tree.xpath(_NON_CONTENT_XPATH):
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+            return tree.text_content()
+        except Exception:
+            pass  # Fall through to the BeautifulSoup path.
+
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Restrict tree building to the <body> subtree; <head> metadata
+    # never contributes visible text. lxml normalizes stray markup
+    # into a <body>, so the strainer is only safe with that parser.
+    parsed = BeautifulSoup(
+        body,
+        "lxml" if lxml_html is not None else "html.parser",
+        parse_only=(
+            SoupStrainer(["body"]) if lxml_html is not None else None
+        ),
+        from_encoding=encoding,
+    )
+    for tag in parsed(_NON_CONTENT_TAGS):
+        tag.decompose()
+    return parsed.get_text(" ")
+
+
+def _declared_charset(page: "requests.Response") -> Optional[str]:
+    """
+    Returns the charset genuinely declared by the Content-Type header.
+    requests reports ISO-8859-1 for any text/* response that omits the
+    charset parameter (an HTTP/1.0 relic), and forwarding that default
+    would force a wrong decode on the mostly-UTF-8 web — treat it as
+    "not declared" so the parser sniffs the document instead.
+    """
+    encoding = page.encoding
+    if encoding and encoding.lower() != "iso-8859-1":
+        return encoding
+    return None
+
+
+_SHARED_SESSION: Optional["requests.Session"] = None
+
+
+def _get_session() -> "requests.Session":
+    """
+    Returns the process-wide HTTP session, creating it on first use.
+    A pooled session keeps connections alive between scrapes, so
+    repeated hits on the same host skip the TCP/TLS handshake. Headers
+    and cookies stay per-request because the session is shared by every
+    tool instance.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SHARED_SESSION = session
+    return _SHARED_SESSION
+
+
+_TOOL_PAGE_CACHE_MAX_ENTRIES: int = 128
+_TOOL_PAGE_CACHE_TTL_SECONDS: float = 300.0
+_TOOL_HEAD_FETCH_CHUNK_BYTES: int = 16_384
+_TOOL_HEAD_FETCH_BYTES_PER_CHAR: int = 8
+_TOOL_HEAD_FETCH_MAX_BYTES: int = 2 * 1024 * 1024
 _TOOL_RANDOM_CHUNKS_BLOCK_SIZE: int = 1_000
 _TOOL_RANDOM_CHUNKS_MIN_MAX_CHARS: int = 3_000
 _TOOL_SUMMARY_MODE_INTERNAL_MAX_CHARS: int = 34_000
 _TOOL_SUMMARY_MODE_TARGET_LENGTH: int = 6_000
 _TOOL_SUMMARY_MIN_VALID_LENGTH: int = 100
 
+# The template is a static prefix and the delimiters below a static
+# suffix, so only the scraped text varies between prompts — the layout
+# providers' prompt-prefix caches like best.
 DEFAULT_SUMMARY_PROMPT_TEMPLATE: str = (
     "Provide a concise summary of the website text below, capturing the "
     "main points and all the key information. The summary should be up to "
-    f"{_TOOL_SUMMARY_MODE_TARGET_LENGTH} characters long. "
-    "Text to summarize:\n\n"
+    f"{_TOOL_SUMMARY_MODE_TARGET_LENGTH} characters long.\n\n"
+    "---BEGIN WEBSITE CONTENT---\n"
 )
 
+_SUMMARY_PROMPT_SUFFIX: str = "\n---END WEBSITE CONTENT---\nSummary:"
+
 DEFAULT_HEADERS: Dict[str, str] = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -45,6 +195,61 @@ DEFAULT_HEADERS: Dict[str, str] = {
 }
 
 
+_DESC_DEFAULT_PROMPT: str = "Uses a default summarization prompt."
+_DESC_CUSTOM_PROMPT: str = "Uses a custom summarization prompt."
+
+
+@lru_cache(maxsize=64)
+def _build_description(
+    retrieval_mode: str,
+    eff_max_chars: Optional[int],
+    uses_default_prompt: bool,
+) -> str:
+    """
+    Renders the dynamic tool description for one configuration.
+    Memoized so factories that instantiate many identically configured
+    tools format the string once.
+    """
+    chars_detail: Optional[str] = None
+    if (
+        retrieval_mode in ["head", "random_chunks"]
+        and eff_max_chars is not None
+    ):
+        chars_detail = (
+            f"It's configured to process up to {eff_max_chars} "
+            "characters from the runtime-provided URL."
+        )
+    elif retrieval_mode == "summarize" and eff_max_chars is not None:
+        chars_detail = (
+            f"It will process up to {eff_max_chars} characters of "
+            "website content (from runtime URL) before summarizing. "
+            "The final summary aims for approx. "
+            f"{_TOOL_SUMMARY_MODE_TARGET_LENGTH} characters."
+        )
+
+    prompt_detail: Optional[str] = None
+    if retrieval_mode == "summarize":
+        prompt_detail = (
+            _DESC_DEFAULT_PROMPT
+            if uses_default_prompt
+            else _DESC_CUSTOM_PROMPT
+        )
+
+    # One join over the applicable fragments; no list mutation or
+    # repeated string concatenation.
+    return " ".join(
+        fragment
+        for fragment in (
+            f"Scrapes content from a website using the "
+            f"'{retrieval_mode}' strategy. A specific URL must always "
+            "be provided by the agent when running this tool.",
+            chars_detail,
+            prompt_detail,
+        )
+        if fragment
+    )
+
+
 class VersatileScrapeWebsiteToolSchema(BaseModel):
     """Input schema for VersatileScrapeWebsiteTool's run method."""
 
@@ -77,6 +282,11 @@ class VersatileScraperToolOutput(BaseModel):
 
     def to_llm_response(self) -> str:
         """Converts the output to a JSON string for the LLM."""
+        if orjson is not None:
+            return orjson.dumps(
+                self.model_dump(exclude_none=True),
+                option=orjson.OPT_INDENT_2,
+            ).decode()
         return self.model_dump_json(exclude_none=True, indent=2)
 
 
@@ -124,6 +334,17 @@ class VersatileScrapeWebsiteTool(BaseTool):
 
     _resolved_cookies: Optional[Dict[str, str]] = PrivateAttr(default=None)
     _eff_max_chars_for_retrieval: Optional[int] = PrivateAttr(default=None)
+    _request_fingerprint: str = PrivateAttr(default="")
+
+    # Cleaned page text keyed by (url, retrieval_mode, max_chars,
+    # request fingerprint). Agents commonly re-request the same URL
+    # within a short window; a hit skips the whole HTTP + parse +
+    # cleanup pipeline, while the TTL keeps the tool from serving
+    # stale pages for long. The fingerprint keeps instances with
+    # different cookies or headers from seeing each other's content.
+    _page_text_cache: ClassVar[
+        Dict[Tuple[str, str, Optional[int], str], Tuple[float, str]]
+    ] = {}
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
@@ -138,6 +359,20 @@ class VersatileScrapeWebsiteTool(BaseTool):
         if self.cookies_config:
             self._resolved_cookies = self.cookies_config
 
+        # Fingerprint the request configuration; two instances scraping
+        # the same URL with different cookies (say, two authenticated
+        # sessions) fetch different content and must not share cache
+        # entries.
+        self._request_fingerprint = hashlib.blake2b(
+            repr(
+                (
+                    sorted(self.request_headers.items()),
+                    sorted((self.cookies_config or {}).items()),
+                )
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
         if self.retrieval_mode == "summarize":
             if not self.llm:
                 raise ValueError(
@@ -164,42 +399,12 @@ class VersatileScrapeWebsiteTool(BaseTool):
                 self.max_chars, _TOOL_RANDOM_CHUNKS_MIN_MAX_CHARS
             )
 
-        base_desc = (
-            f"Scrapes content from a website using the "
-            f"'{self.retrieval_mode}' strategy. A specific URL must always "
-            "be provided by the agent when running this tool."
+        self.description = _build_description(
+            self.retrieval_mode,
+            self._eff_max_chars_for_retrieval,
+            self.summary_prompt_template == DEFAULT_SUMMARY_PROMPT_TEMPLATE,
         )
-        details = []
-        if (
-            self.retrieval_mode in ["head", "random_chunks"]
-            and self._eff_max_chars_for_retrieval is not None
-        ):
-            details.append(
-                f"It's configured to process up to "
-                f"{self._eff_max_chars_for_retrieval} characters from the "
-                "runtime-provided URL."
-            )
-        elif (
-            self.retrieval_mode == "summarize"
-            and self._eff_max_chars_for_retrieval is not None
-        ):
-            details.append(
-                f"It will process up to {self._eff_max_chars_for_retrieval} "
-                f"characters of website content (from runtime URL) before "
-                f"summarizing. The final summary aims for approx. "
-                f"{_TOOL_SUMMARY_MODE_TARGET_LENGTH} characters."
-            )
 
-        if self.retrieval_mode == "summarize":
-            if self.summary_prompt_template == DEFAULT_SUMMARY_PROMPT_TEMPLATE:
-                details.append("Uses a default summarization prompt.")
-            else:
-                details.append("Uses a custom summarization prompt.")
-
-        self.description = base_desc
-        if details:
-            self.description += " " + " ".join(details)
-        
         # Rebuild the final description
         self._generate_description()
 
@@ -214,6 +419,8 @@ class VersatileScrapeWebsiteTool(BaseTool):
         and the mandatory runtime website_url.
         Returns a JSON string of VersatileScraperToolOutput.
         """
+        import requests
+
         if not website_url.strip():  # Check for empty or whitespace-only URL
             output = VersatileScraperToolOutput(
                 error_message="A non-empty website URL must be provided.",
@@ -222,21 +429,160 @@ class VersatileScrapeWebsiteTool(BaseTool):
             )
             return output.to_llm_response()
 
+        cached_text = self._cached_page_text(website_url)
+        if cached_text is not None:
+            return self._respond_with_text(cached_text, website_url)
+
         try:
-            page = requests.get(
-                website_url,
-                timeout=15,
-                headers=self.request_headers,
-                cookies=self._resolved_cookies or {},
+            body, declared_encoding = self._fetch_body(website_url)
+        except requests.exceptions.RequestException as e:
+            output = VersatileScraperToolOutput(
+                error_message=f"HTTP error scraping {website_url}: {e}",
+                source_url=website_url,
+                retrieval_mode_used=self.retrieval_mode,
             )
-            page.raise_for_status()
-            page.encoding = page.apparent_encoding
-            parsed = BeautifulSoup(page.text, "html.parser")
+            return output.to_llm_response()
+        except Exception as e:
+            output = VersatileScraperToolOutput(
+                error_message=f"Unexpected error processing {website_url}: {e}",
+                source_url=website_url,
+                retrieval_mode_used=self.retrieval_mode,
+            )
+            return output.to_llm_response()
+
+        return self._process_body(body, declared_encoding, website_url)
+
+    async def _arun(
+        self,
+        website_url: str,
+    ) -> str:
+        """
+        Async variant of _run. With aiohttp installed the fetch awaits
+        on the event loop, so batched agents overlap their network
+        waits instead of serializing them; parsing and cleanup still
+        run in a worker thread to keep the loop responsive. Without
+        aiohttp the whole sync path runs in a thread.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = None  # type: ignore[assignment]
+
+        if aiohttp is None or not website_url.strip():
+            return await asyncio.to_thread(self._run, website_url)
+
+        cached_text = self._cached_page_text(website_url)
+        if cached_text is not None:
+            return await asyncio.to_thread(
+                self._respond_with_text, cached_text, website_url
+            )
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=15)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(
+                    website_url,
+                    headers=self.request_headers,
+                    cookies=self._resolved_cookies or {},
+                ) as response:
+                    response.raise_for_status()
+                    declared_encoding = response.charset
+                    if self.retrieval_mode == "head":
+                        # Same bounded download as the sync head path.
+                        received = bytearray()
+                        async for chunk in response.content.iter_chunked(
+                            _TOOL_HEAD_FETCH_CHUNK_BYTES
+                        ):
+                            received.extend(chunk)
+                            if len(received) >= self._head_byte_budget():
+                                break
+                        body = bytes(received)
+                    else:
+                        body = await response.read()
+        except Exception as e:
+            output = VersatileScraperToolOutput(
+                error_message=f"HTTP error scraping {website_url}: {e}",
+                source_url=website_url,
+                retrieval_mode_used=self.retrieval_mode,
+            )
+            return output.to_llm_response()
+
+        return await asyncio.to_thread(
+            self._process_body, body, declared_encoding, website_url
+        )
+
+    def _process_body(
+        self,
+        body: bytes,
+        declared_encoding: Optional[str],
+        website_url: str,
+    ) -> str:
+        """
+        Extracts, cleans and post-processes a fetched body, returning
+        the JSON response string. Shared by the sync and async paths.
+        """
+        try:
+            # Parse the raw bytes: the parser sniffs the charset itself,
+            # which skips both the apparent_encoding detection pass and
+            # the full-body decode that page.text would perform.
+            text_content = _clean_whitespace(
+                _extract_text(body, declared_encoding)
+            )
+        except Exception as e:
+            output = VersatileScraperToolOutput(
+                error_message=f"Unexpected error processing {website_url}: {e}",
+                source_url=website_url,
+                retrieval_mode_used=self.retrieval_mode,
+            )
+            return output.to_llm_response()
 
-            text_content = parsed.get_text(" ")
-            text_content = re.sub(r"[ \t]+", " ", text_content)
-            text_content = re.sub(r"\s*\n\s*", "\n", text_content).strip()
+        if text_content:  # Never cache an empty extraction
+            self._cache_page_text(website_url, text_content)
+        return self._respond_with_text(text_content, website_url)
+
+    def _cache_key(
+        self, website_url: str
+    ) -> Tuple[str, str, Optional[int], str]:
+        return (
+            website_url,
+            self.retrieval_mode,
+            self.max_chars,
+            self._request_fingerprint,
+        )
 
+    def _cached_page_text(self, website_url: str) -> Optional[str]:
+        """Returns unexpired cached page text for this configuration."""
+        key = self._cache_key(website_url)
+        entry = self._page_text_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, text_content = entry
+        if time.monotonic() - cached_at >= _TOOL_PAGE_CACHE_TTL_SECONDS:
+            del self._page_text_cache[key]
+            return None
+        return text_content
+
+    def _cache_page_text(
+        self, website_url: str, text_content: str
+    ) -> None:
+        cache = type(self)._page_text_cache
+        if len(cache) >= _TOOL_PAGE_CACHE_MAX_ENTRIES:
+            # Evict the stalest entry; a linear scan over 128 keys is
+            # nothing next to the scrape it replaces.
+            del cache[min(cache, key=lambda k: cache[k][0])]
+        cache[self._cache_key(website_url)] = (
+            time.monotonic(),
+            text_content,
+        )
+
+    def _respond_with_text(
+        self, text_content: str, website_url: str
+    ) -> str:
+        """
+        Applies the configured retrieval strategy to cleaned page text
+        and wraps the result (or failure) in the JSON response.
+        """
+        try:
             if not text_content:
                 output = VersatileScraperToolOutput(
                     scraped_content="No text content found on the website "
@@ -274,12 +620,6 @@ class VersatileScrapeWebsiteTool(BaseTool):
                 retrieval_mode_used=self.retrieval_mode,
             )
             return output.to_llm_response()
-        except requests.exceptions.RequestException as e:
-            output = VersatileScraperToolOutput(
-                error_message=f"HTTP error scraping {website_url}: {e}",
-                source_url=website_url,
-                retrieval_mode_used=self.retrieval_mode,
-            )
         except ValueError as e:  # For issues like failed summary
             output = VersatileScraperToolOutput(
                 error_message=f"Processing error for {website_url}: {e}",
@@ -294,6 +634,51 @@ class VersatileScrapeWebsiteTool(BaseTool):
             )
         return output.to_llm_response()
 
+    def _fetch_body(self, website_url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Downloads the page body, bounding the transfer in 'head' mode.
+        Returns the raw bytes plus the charset declared by the response
+        headers (None when the server declared none).
+        """
+        if self.retrieval_mode != "head":
+            page = _get_session().get(
+                website_url,
+                timeout=15,
+                headers=self.request_headers,
+                cookies=self._resolved_cookies or {},
+            )
+            page.raise_for_status()
+            return page.content, _declared_charset(page)
+
+        # head mode only ever surfaces max_chars characters, so stream
+        # the response and stop at a generous HTML-to-text byte ratio
+        # instead of downloading the whole document. Truncated HTML
+        # still parses; the tail would have been discarded anyway.
+        byte_budget = self._head_byte_budget()
+        with _get_session().get(
+            website_url,
+            timeout=15,
+            headers=self.request_headers,
+            cookies=self._resolved_cookies or {},
+            stream=True,
+        ) as page:
+            page.raise_for_status()
+            received = bytearray()
+            for chunk in page.iter_content(
+                chunk_size=_TOOL_HEAD_FETCH_CHUNK_BYTES
+            ):
+                received.extend(chunk)
+                if len(received) >= byte_budget:
+                    break
+            return bytes(received), _declared_charset(page)
+
+    def _head_byte_budget(self) -> int:
+        return min(
+            self._eff_max_chars_for_retrieval  # type: ignore
+            * _TOOL_HEAD_FETCH_BYTES_PER_CHAR,
+            _TOOL_HEAD_FETCH_MAX_BYTES,
+        )
+
     def _retrieve_head_content(
         self,
         full_content: str,
@@ -314,46 +699,49 @@ class VersatileScrapeWebsiteTool(BaseTool):
             return full_content  # Already within limit
 
         block_size = _TOOL_RANDOM_CHUNKS_BLOCK_SIZE
-        num_blocks_select = math.floor(eff_max_chars / block_size)
+        num_blocks_select = eff_max_chars // block_size
         if num_blocks_select == 0 and eff_max_chars > 0:
             num_blocks_select = 1  # Ensure at least one block selected
 
-        all_blocks = [
-            full_content[i : i + block_size]
-            for i in range(0, len(full_content), block_size)
-        ]
-        if not all_blocks:
+        # Work with block indices only; slice just the selected ranges
+        # instead of materializing every block of the content.
+        total_blocks = (len(full_content) + block_size - 1) // block_size
+        if total_blocks == 0:
             return ""
 
-        if len(all_blocks) <= num_blocks_select:
+        if total_blocks <= num_blocks_select:
             # Not enough blocks to warrant complex selection, join and truncate
-            return ("...".join(all_blocks))[:eff_max_chars]
+            return ("...".join(
+                full_content[i * block_size : (i + 1) * block_size]
+                for i in range(total_blocks)
+            ))[:eff_max_chars]
 
         selected_indices: Set[int] = set()
         if num_blocks_select > 0:
             selected_indices.add(0)  # First block
-        if num_blocks_select > 1 and len(all_blocks) > 1:
+        if num_blocks_select > 1 and total_blocks > 1:
             # Add last block if distinct from first
-            if (len(all_blocks) - 1) != 0:
-                selected_indices.add(len(all_blocks) - 1)
+            if (total_blocks - 1) != 0:
+                selected_indices.add(total_blocks - 1)
 
         needed_middle = num_blocks_select - len(selected_indices)
-        # Potential middle blocks
-        middle_indices = [i for i in range(1, len(all_blocks) - 1)]
-
-        if needed_middle > 0 and middle_indices:
-            random.shuffle(middle_indices)
-            for i in range(min(needed_middle, len(middle_indices))):
-                selected_indices.add(middle_indices[i])
 
-        result_parts = [all_blocks[i] for i in sorted(list(selected_indices))]
-
-        final_str = "...".join(result_parts)
-        # Add ellipsis if content was indeed truncated by selection
-        if len(all_blocks) > num_blocks_select and num_blocks_select > 0:
-            final_str += "..."
+        if needed_middle > 0 and total_blocks > 2:
+            # sample() draws k middle indices in O(k) straight from the
+            # range, instead of shuffling every candidate index.
+            selected_indices.update(
+                random.sample(
+                    range(1, total_blocks - 1),
+                    min(needed_middle, total_blocks - 2),
+                )
+            )
 
-        return final_str[:eff_max_chars]
+        body = "...".join(
+            full_content[i * block_size : (i + 1) * block_size]
+            for i in sorted(selected_indices)
+        )
+        # Selection always truncated here, so mark it with an ellipsis
+        return (body + "...")[:eff_max_chars]
 
     def _retrieve_summarized_content(
         self,
@@ -367,11 +755,20 @@ class VersatileScrapeWebsiteTool(BaseTool):
         if not context.strip():
             raise ValueError("No content extracted from website to summarize.")
 
-        prompt = self.summary_prompt_template + "\n" + context
+        prompt = (
+            self.summary_prompt_template + context + _SUMMARY_PROMPT_SUFFIX
+        )
         raw_summary = ""
         last_exc: Optional[Exception] = None
 
-        for _ in range(3):  # Up to 3 attempts
+        for attempt in range(3):  # Up to 3 attempts
+            if attempt > 0:
+                # Back-to-back retries tend to re-hit the same rate
+                # limit or transient fault; exponential backoff with a
+                # little jitter spreads the attempts out.
+                time.sleep(
+                    (2 ** (attempt - 1)) * 0.5 + random.random() * 0.1
+                )
             try:
                 llm_response = llm.call(prompt)
 
@@ -380,6 +777,10 @@ class VersatileScrapeWebsiteTool(BaseTool):
 
                     if len(summary) >= _TOOL_SUMMARY_MIN_VALID_LENGTH:
                         return summary[:_TOOL_SUMMARY_MODE_TARGET_LENGTH]
+                    elif not summary:
+                        # An empty completion is terminal for an
+                        # identical prompt; retrying only burns tokens.
+                        break
                     else:
                         raw_summary = summary  # Store if too short
                 else:  # Non-string response